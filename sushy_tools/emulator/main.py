@@ -274,12 +274,14 @@ def thermal_resource(identity):
 @app.route('/redfish/v1/Managers')
 @returns_json
 def manager_collection_resource():
+    managers = app.managers.managers
+
     app.logger.debug('Serving managers list')
 
     return flask.render_template(
         'manager_collection.json',
-        manager_count=len(app.managers.managers),
-        managers=app.managers.managers)
+        manager_count=len(managers),
+        managers=managers)
 
 
 def jsonify(obj_type, obj_version, obj):
@@ -58,10 +58,12 @@ class StaticDriver(base.DriverBase):
         :returns: indicator state as one of *Lit*, *Blinking*,
                 *Off*
         """
-        if identity not in self._indicators:
-            self._indicators[identity] = 'Lit'
+        try:
+            return self._indicators[identity]
 
-        return self._indicators[identity]
+        except KeyError:
+            self._indicators[identity] = 'Lit'
+            return 'Lit'
 
     def set_indicator_state(self, identity, state):
         """Set indicator state
@@ -90,6 +90,14 @@ class LibvirtDriver(AbstractSystemsDriver):
 
     INTERFACE_MAP_REV = {v: k for k, v in INTERFACE_MAP.items()}
 
+    # libvirt device elements that may carry per-device boot order, in
+    # lookup order: element tag, reverse boot device map and the element
+    # attribute holding the device type (`None` if it is always network)
+    BOOT_ORDER_DEVICES = (
+        ('disk', DISK_DEVICE_MAP_REV, 'device'),
+        ('interface', INTERFACE_MAP_REV, None),
+    )
+
     LIBVIRT_URI = 'qemu:///system'
 
     BOOT_MODE_MAP = {
@@ -286,9 +294,19 @@ class LibvirtDriver(AbstractSystemsDriver):
 
         tree = ET.fromstring(domain.XMLDesc(libvirt.VIR_DOMAIN_XML_INACTIVE))
 
+        return self._find_boot_device(tree)
+
+    def _find_boot_device(self, domain_tree):
+        """Find boot device name in libvirt domain XML
+
+        :param domain_tree: libvirt domain XML element tree
+
+        :returns: boot device name as `str` or `None` if device name
+            can't be determined
+        """
         # Try boot configuration in the bootloader
 
-        boot_element = tree.find('.//boot')
+        boot_element = domain_tree.find('.//boot')
         if boot_element is not None:
             dev_attr = boot_element.get('dev')
             if dev_attr is not None:
@@ -300,50 +318,31 @@ class LibvirtDriver(AbstractSystemsDriver):
 
         # If bootloader config is not present, try per-device boot elements
 
-        devices_element = tree.find('devices')
+        devices_element = domain_tree.find('devices')
 
         if devices_element is not None:
 
-            for disk_element in devices_element.findall('disk'):
-                boot_element = disk_element.find('boot')
-                if boot_element is None:
-                    continue
+            for tag, device_map, attr in self.BOOT_ORDER_DEVICES:
+                for device_element in devices_element.findall(tag):
+                    boot_element = device_element.find('boot')
+                    if boot_element is None:
+                        continue
 
-                order = boot_element.get('order')
-                if not order:
-                    continue
-
-                order = int(order)
-                if min_order is not None and order >= min_order:
-                    continue
+                    order = boot_element.get('order')
+                    if not order:
+                        continue
 
-                device_attr = disk_element.get('device')
-                if device_attr is None:
-                    continue
+                    order = int(order)
+                    if min_order is not None and order >= min_order:
+                        continue
 
-                boot_source_target = self.DISK_DEVICE_MAP_REV.get(
-                    device_attr)
+                    device_type = (device_element.get(attr)
+                                   if attr else 'network')
 
-                if boot_source_target:
-                    min_order = order
-
-            for interface_element in devices_element.findall('interface'):
-                boot_element = interface_element.find('boot')
-                if boot_element is None:
-                    continue
-
-                order = boot_element.get('order')
-                if not order:
-                    continue
-
-                order = int(order)
-                if min_order is not None and order >= min_order:
-                    continue
-
-                boot_source_target = self.INTERFACE_MAP_REV.get('network')
-
-                if boot_source_target:
-                    min_order = order
+                    boot_source = device_map.get(device_type)
+                    if boot_source:
+                        boot_source_target = boot_source
+                        min_order = order
 
         return boot_source_target
 
@@ -366,9 +365,32 @@ class LibvirtDriver(AbstractSystemsDriver):
         # XML schema: https://libvirt.org/formatdomain.html#elementsOSBIOS
         tree = ET.fromstring(domain.XMLDesc(libvirt.VIR_DOMAIN_XML_INACTIVE))
 
+        self._update_boot_device(domain, tree, boot_source)
+
+        try:
+            with libvirt_open(self._uri) as conn:
+                conn.defineXML(ET.tostring(tree).decode('utf-8'))
+
+        except libvirt.libvirtError as e:
+            msg = ('Error changing boot device at libvirt URI "%(uri)s": '
+                   '%(error)s' % {'uri': self._uri, 'error': e})
+
+            raise error.FishyError(msg)
+
+    def _update_boot_device(self, domain, domain_tree, boot_source):
+        """Make boot device the only bootable one in libvirt domain XML
+
+        :param domain: libvirt domain the XML belongs to
+        :param domain_tree: libvirt domain XML element tree to update
+            in place
+        :param boot_source: string literal requesting boot device
+            change on the system. Valid values are: *Pxe*, *Hdd*, *Cd*.
+
+        :raises: `error.FishyError` if boot device can't be set
+        """
         # Remove bootloader configuration
 
-        for os_element in tree.findall('os'):
+        for os_element in domain_tree.findall('os'):
             for boot_element in os_element.findall('boot'):
                 os_element.remove(boot_element)
 
@@ -376,7 +398,7 @@ class LibvirtDriver(AbstractSystemsDriver):
 
         # Process per-device boot configuration
 
-        devices_element = tree.find('devices')
+        devices_element = domain_tree.find('devices')
         if devices_element is None:
             msg = ('Incomplete libvirt domain configuration - <devices> '
                    'element is missing in domain '
@@ -426,16 +448,6 @@ class LibvirtDriver(AbstractSystemsDriver):
             boot_element = ET.SubElement(target_device_element, 'boot')
             boot_element.set('order', str(order + 1))
 
-        try:
-            with libvirt_open(self._uri) as conn:
-                conn.defineXML(ET.tostring(tree).decode('utf-8'))
-
-        except libvirt.libvirtError as e:
-            msg = ('Error changing boot device at libvirt URI "%(uri)s": '
-                   '%(error)s' % {'uri': self._uri, 'error': e})
-
-            raise error.FishyError(msg)
-
     def get_boot_mode(self, identity):
         """Get computer system boot mode.
 
@@ -447,7 +459,17 @@ class LibvirtDriver(AbstractSystemsDriver):
         # XML schema: https://libvirt.org/formatdomain.html#elementsOSBIOS
         tree = ET.fromstring(domain.XMLDesc(libvirt.VIR_DOMAIN_XML_INACTIVE))
 
-        loader_element = tree.find('.//loader')
+        return self._find_boot_mode(tree)
+
+    def _find_boot_mode(self, domain_tree):
+        """Find boot mode in libvirt domain XML
+
+        :param domain_tree: libvirt domain XML element tree
+
+        :returns: either *UEFI* or *Legacy* as `str` or `None` if
+            current boot mode can't be determined
+        """
+        loader_element = domain_tree.find('.//loader')
 
         if loader_element is not None:
             boot_mode = (
@@ -574,8 +596,6 @@ class LibvirtDriver(AbstractSystemsDriver):
         """
         domain = self._get_domain(identity, readonly=True)
 
-        tree = ET.fromstring(domain.XMLDesc(libvirt.VIR_DOMAIN_XML_INACTIVE))
-
         total_cpus = 0
 
         if domain.isActive():
@@ -584,6 +604,9 @@ class LibvirtDriver(AbstractSystemsDriver):
         # If we can't get it from maxVcpus() try to find it by
         # inspecting the domain XML
         if total_cpus <= 0:
+            tree = ET.fromstring(
+                domain.XMLDesc(libvirt.VIR_DOMAIN_XML_INACTIVE))
+
             vcpu_element = tree.find('.//vcpu')
             if vcpu_element is not None:
                 total_cpus = int(vcpu_element.text)
@@ -766,11 +789,12 @@ class LibvirtDriver(AbstractSystemsDriver):
                    '"%(identity)s" configuration' % {'identity': identity})
             raise error.FishyError(msg)
 
-        for disk_element in device_element.findall('disk'):
-            dev_type = disk_element.attrib.get('device')
-            if (dev_type not in self.DEVICE_TYPE_MAP_REV
-                    or dev_type != self.DEVICE_TYPE_MAP.get(device)):
-                continue
+        lv_device = self.DEVICE_TYPE_MAP.get(device)
+        if lv_device is None:
+            return '', False, False
+
+        for disk_element in device_element.findall(
+                "disk[@device='%s']" % lv_device):
 
             source_element = disk_element.find('source')
             if source_element is None:
@@ -783,10 +807,10 @@ class LibvirtDriver(AbstractSystemsDriver):
             read_only = disk_element.find('readonly') or False
 
             inserted = (
-                self.get_boot_device(identity) == constants.DEVICE_TYPE_CD
+                self._find_boot_device(tree) == constants.DEVICE_TYPE_CD
             )
             if inserted:
-                inserted = self.get_boot_mode(identity) == 'UEFI'
+                inserted = self._find_boot_mode(tree) == 'UEFI'
 
             return boot_image, read_only, inserted
 
@@ -816,9 +840,13 @@ class LibvirtDriver(AbstractSystemsDriver):
 
         # Remove already existing volume
 
-        volumes_names = [v.name() for v in pool.listAllVolumes()]
-        if image_name in volumes_names:
+        try:
             volume = pool.storageVolLookupByName(image_name)
+
+        except libvirt.libvirtError:
+            pass
+
+        else:
             volume.delete()
 
         # Create new volume
@@ -864,36 +892,20 @@ class LibvirtDriver(AbstractSystemsDriver):
                 raise error.FishyError(
                     'Unknown device %s at %s' % (device, identity))
 
-            disk_elements = device_element.findall('disk')
-            controller_type = 'ide'
-            for disk_element in disk_elements:
-                target_element = disk_element.find('target')
-                if target_element is None:
-                    continue
-                elif target_element.attrib.get('bus') == 'scsi':
-                    controller_type = 'scsi'
-                elif target_element.attrib.get('bus') == 'sata':
-                    controller_type = 'sata'
+            # Enumerate existing disks to learn the controller type and
+            # the units already taken on each bus
 
-            if controller_type == 'ide':
-                tgt_dev, tgt_bus = self.DEVICE_TARGET_MAP[device]
-            else:
-                tgt_dev, tgt_bus = ('sdc', controller_type)
-
-            # Enumerate existing disks to find a free unit on the bus
-
-            free_units = {i for i in range(100)}
-
-            disk_elements = device_element.findall('disk')
+            controller_type = 'ide'
+            used_units = defaultdict(set)
 
-            for disk_element in disk_elements:
+            for disk_element in device_element.findall('disk'):
                 target_element = disk_element.find('target')
                 if target_element is None:
                     continue
 
                 bus_type = target_element.attrib.get('bus')
-                if bus_type != tgt_bus:
-                    continue
+                if bus_type in ('scsi', 'sata'):
+                    controller_type = bus_type
 
                 address_element = disk_element.find('address')
                 if address_element is None:
@@ -903,8 +915,14 @@ class LibvirtDriver(AbstractSystemsDriver):
                 if unit_num is None:
                     continue
 
-                if int(unit_num) in free_units:
-                    free_units.remove(int(unit_num))
+                used_units[bus_type].add(int(unit_num))
+
+            if controller_type == 'ide':
+                tgt_dev, tgt_bus = self.DEVICE_TARGET_MAP[device]
+            else:
+                tgt_dev, tgt_bus = ('sdc', controller_type)
+
+            free_units = set(range(100)) - used_units[tgt_bus]
 
             if not free_units:
                 msg = ('No free %(bus)s bus unit found in the libvirt domain '
@@ -982,15 +1000,18 @@ class LibvirtDriver(AbstractSystemsDriver):
         domain_tree = ET.fromstring(
             domain.XMLDesc(libvirt.VIR_DOMAIN_XML_INACTIVE))
 
-        self._remove_boot_images(domain, domain_tree, device)
+        # NOTE: re-plugging the image drops its per-device boot
+        # configuration, remember the boot device to restore it
+        boot_device = self._find_boot_device(domain_tree)
 
-        boot_device = None
+        self._remove_boot_images(domain, domain_tree, device)
 
         if boot_image:
             self._add_boot_image(domain, domain_tree, device,
                                  boot_image, write_protected)
 
-            boot_device = self.get_boot_device(identity)
+            if device == boot_device:
+                self._update_boot_device(domain, domain_tree, boot_device)
 
         with libvirt_open(self._uri) as conn:
             xml = ET.tostring(domain_tree)
@@ -1006,64 +1027,61 @@ class LibvirtDriver(AbstractSystemsDriver):
 
                 raise error.FishyError(msg)
 
-        if device == boot_device:
-            self.set_boot_device(identity, boot_device)
-
-    def _find_device_by_path(self, vol_path):
+    def _find_device_by_path(self, conn, vol_path):
         """Get device attributes using path
 
+        :param conn: libvirt connection to look the volume up through
         :param vol_path: path for the libvirt volume
         :returns: a dict (or None) of the corresponding device attributes
         """
-        with libvirt_open(self._uri, readonly=True) as conn:
-            try:
-                vol = conn.storageVolLookupByPath(vol_path)
-            except libvirt.libvirtError as e:
-                msg = ('Could not find storage volume by path '
-                       '"%(path)s" at libvirt URI "%(uri)s": '
-                       '%(err)s' %
-                       {'path': vol_path, 'uri': self._uri,
-                        'err': e})
-                self._logger.debug(msg)
-                return
-            disk_device = {
-                'Name': vol.name(),
-                'CapacityBytes': vol.info()[1]
-            }
-            return disk_device
+        try:
+            vol = conn.storageVolLookupByPath(vol_path)
+        except libvirt.libvirtError as e:
+            msg = ('Could not find storage volume by path '
+                   '"%(path)s" at libvirt URI "%(uri)s": '
+                   '%(err)s' %
+                   {'path': vol_path, 'uri': self._uri,
+                    'err': e})
+            self._logger.debug(msg)
+            return
+        disk_device = {
+            'Name': vol.name(),
+            'CapacityBytes': vol.info()[1]
+        }
+        return disk_device
 
-    def _find_device_from_pool(self, pool_name, vol_name):
+    def _find_device_from_pool(self, conn, pool_name, vol_name):
         """Get device attributes from pool
 
+        :param conn: libvirt connection to look the volume up through
         :param pool_name: libvirt pool name
         :param vol_name: libvirt volume name
         :returns: a dict (or None) of the corresponding device attributes
         """
-        with libvirt_open(self._uri, readonly=True) as conn:
-            try:
-                pool = conn.storagePoolLookupByName(pool_name)
-            except libvirt.libvirtError as e:
-                msg = ('Error finding Storage Pool by name "%(name)s" at'
-                       'libvirt URI "%(uri)s": %(err)s' %
-                       {'name': pool_name, 'uri': self._uri, 'err': e})
-                self._logger.debug(msg)
-                return
+        try:
+            pool = conn.storagePoolLookupByName(pool_name)
+        except libvirt.libvirtError as e:
+            msg = ('Error finding Storage Pool by name "%(name)s" at'
+                   'libvirt URI "%(uri)s": %(err)s' %
+                   {'name': pool_name, 'uri': self._uri, 'err': e})
+            self._logger.debug(msg)
+            return
 
-            try:
-                vol = pool.storageVolLookupByName(vol_name)
-            except libvirt.libvirtError as e:
-                msg = ('Error finding Storage Volume by name "%(name)s" '
-                       'in Pool '"%(pName)s"' at libvirt URI "%(uri)s"'
-                       ': %(err)s' %
-                       {'name': vol_name, 'pName': pool_name,
-                        'uri': self._uri, 'err': e})
-                self._logger.debug(msg)
-                return
-            disk_device = {
-                'Name': vol.name(),
-                'CapacityBytes': vol.info()[1]
-            }
-            return disk_device
+        try:
+            vol = pool.storageVolLookupByName(vol_name)
+        except libvirt.libvirtError as e:
+            msg = ('Error finding Storage Volume by name "%(name)s" '
+                   'in Pool '"%(pName)s"' at libvirt URI "%(uri)s"'
+                   ': %(err)s' %
+                   {'name': vol_name, 'pName': pool_name,
+                    'uri': self._uri, 'err': e})
+            self._logger.debug(msg)
+            return
+        disk_device = {
+            'Name': vol.name(),
+            'CapacityBytes': vol.info()[1]
+        }
+        return disk_device
 
     def get_simple_storage_collection(self, identity):
         """Get a dict of simple storage controllers and their devices
@@ -1072,6 +1090,8 @@ class LibvirtDriver(AbstractSystemsDriver):
         via a pool and attached to the domain will reflect as a device.
         Others are skipped.
 
+        All volume lookups share a single read-only libvirt connection.
+
         :param identity: libvirt domain or ID
         :returns: dict of simple storage controller dict with their attributes
         """
@@ -1079,9 +1099,11 @@ class LibvirtDriver(AbstractSystemsDriver):
         tree = ET.fromstring(domain.XMLDesc(libvirt.VIR_DOMAIN_XML_INACTIVE))
         simple_storage = defaultdict(lambda: defaultdict(DeviceList=list()))
 
-        for disk_element in tree.findall(".//disk/target[@bus]/.."):
-            source_element = disk_element.find('source')
-            if source_element is not None:
+        with libvirt_open(self._uri, readonly=True) as conn:
+            for disk_element in tree.findall(".//disk/target[@bus]/.."):
+                source_element = disk_element.find('source')
+                if source_element is None:
+                    continue
                 disk_type = disk_element.attrib['type']
                 ctl_type = disk_element.find('target').attrib['bus']
                 disk_device = None
@@ -1090,12 +1112,12 @@ class LibvirtDriver(AbstractSystemsDriver):
                         vol_path = source_element.attrib['file']
                     else:
                         vol_path = source_element.attrib['dev']
-                    disk_device = self._find_device_by_path(vol_path)
+                    disk_device = self._find_device_by_path(conn, vol_path)
                 elif disk_type == 'volume':
                     pool_name = source_element.attrib['pool']
                     vol_name = source_element.attrib['volume']
-                    disk_device = self._find_device_from_pool(pool_name,
-                                                              vol_name)
+                    disk_device = self._find_device_from_pool(
+                        conn, pool_name, vol_name)
                 if disk_device is not None:
                     simple_storage[ctl_type]['Id'] = ctl_type
                     simple_storage[ctl_type]['Name'] = ctl_type
@@ -34,6 +34,13 @@ class OpenStackDriver(AbstractSystemsDriver):
 
     NOVA_POWER_STATE_ON = 1
 
+    # NOTE(etingof) can't support `state == "Nmi"` as
+    # openstacksdk does not seem to support that
+    POWER_STATES = frozenset([
+        'On', 'ForceOn', 'ForceOff', 'GracefulShutdown',
+        'GracefulRestart', 'ForceRestart'
+    ])
+
     BOOT_DEVICE_MAP = {
         'Pxe': 'network',
         'Hdd': 'hd',
@@ -159,38 +166,38 @@ class OpenStackDriver(AbstractSystemsDriver):
         :raises: `error.FishyError` if power state can't be set
 
         """
+        if state not in self.POWER_STATES:
+            raise error.FishyError(
+                'Unknown ResetType "%(state)s"' % {'state': state})
+
         instance = self._get_instance(identity)
 
+        powered_on = instance.power_state == self.NOVA_POWER_STATE_ON
+
         if state in ('On', 'ForceOn'):
-            if instance.power_state != self.NOVA_POWER_STATE_ON:
+            if not powered_on:
                 self._cc.compute.start_server(instance.id)
 
         elif state == 'ForceOff':
-            if instance.power_state == self.NOVA_POWER_STATE_ON:
+            if powered_on:
                 self._cc.compute.stop_server(instance.id)
 
         elif state == 'GracefulShutdown':
-            if instance.power_state == self.NOVA_POWER_STATE_ON:
+            if powered_on:
                 self._cc.compute.stop_server(instance.id)
 
         elif state == 'GracefulRestart':
-            if instance.power_state == self.NOVA_POWER_STATE_ON:
+            if powered_on:
                 self._cc.compute.reboot_server(
                     instance.id, reboot_type='SOFT'
                 )
 
         elif state == 'ForceRestart':
-            if instance.power_state == self.NOVA_POWER_STATE_ON:
+            if powered_on:
                 self._cc.compute.reboot_server(
                     instance.id, reboot_type='HARD'
                 )
 
-        # NOTE(etingof) can't support `state == "Nmi"` as
-        # openstacksdk does not seem to support that
-        else:
-            raise error.FishyError(
-                'Unknown ResetType "%(state)s"' % {'state': state})
-
     def get_boot_device(self, identity):
         """Get computer system boot device name
 
@@ -271,6 +271,20 @@ class LibvirtDriverTestCase(base.BaseTestCase):
 
         self.assertEqual('Pxe', boot_device)
 
+    @mock.patch('libvirt.openReadOnly', autospec=True)
+    def test_get_boot_device_unknown_disk_type(self, libvirt_mock):
+        with open('sushy_tools/tests/unit/emulator/'
+                  'domain_boot_lun.xml', 'r') as f:
+            data = f.read()
+
+        conn_mock = libvirt_mock.return_value
+        domain_mock = conn_mock.lookupByUUID.return_value
+        domain_mock.XMLDesc.return_value = data
+
+        boot_device = self.test_driver.get_boot_device(self.uuid)
+
+        self.assertEqual('Hdd', boot_device)
+
     @mock.patch('libvirt.open', autospec=True)
     def test_set_boot_device_network(self, libvirt_mock):
         with open('sushy_tools/tests/unit/emulator/'
@@ -486,6 +500,21 @@ class LibvirtDriverTestCase(base.BaseTestCase):
         expected = '/home/user/boot.iso', False, False
 
         self.assertEqual(expected, image_info)
+        domain_mock.XMLDesc.assert_called_once_with(
+            libvirt.VIR_DOMAIN_XML_INACTIVE)
+
+    @mock.patch('libvirt.openReadOnly', autospec=True)
+    def test_get_boot_image_unknown_device(self, libvirt_mock):
+        with open('sushy_tools/tests/unit/emulator/domain.xml', 'r') as f:
+            data = f.read()
+
+        conn_mock = libvirt_mock.return_value
+        domain_mock = conn_mock.lookupByUUID.return_value
+        domain_mock.XMLDesc.return_value = data
+
+        image_info = self.test_driver.get_boot_image(self.uuid, 'Hdd')
+
+        self.assertEqual(('', False, False), image_info)
 
     @mock.patch('sushy_tools.emulator.resources.systems.libvirtdriver'
                 '.os.stat', autospec=True)
@@ -512,13 +541,16 @@ class LibvirtDriverTestCase(base.BaseTestCase):
         with mock.patch.object(
                 self.test_driver, 'get_power_state', return_value='Off'):
             with mock.patch.object(
-                    self.test_driver, 'get_boot_device', return_value=None):
+                    self.test_driver, '_find_boot_device', return_value=None):
 
                 self.test_driver.set_boot_image(
                     self.uuid, 'Cd', '/tmp/image.iso')
 
         conn_mock = libvirt_rw_mock.return_value
-        pool_mock.listAllVolumes.assert_called_once_with()
+        pool_mock.storageVolLookupByName.assert_called_once_with(
+            'image-iso-%s.img' % domain_mock.UUIDString.return_value)
+        old_volume_mock = pool_mock.storageVolLookupByName.return_value
+        old_volume_mock.delete.assert_called_once_with()
         stat_mock.assert_called_once_with('/tmp/image.iso')
         pool_mock.createXML.assert_called_once_with(mock.ANY)
 
@@ -565,13 +597,16 @@ class LibvirtDriverTestCase(base.BaseTestCase):
         with mock.patch.object(
                 self.test_driver, 'get_power_state', return_value='Off'):
             with mock.patch.object(
-                    self.test_driver, 'get_boot_device', return_value=None):
+                    self.test_driver, '_find_boot_device', return_value=None):
 
                 self.test_driver.set_boot_image(
                     self.uuid, 'Cd', '/tmp/image.iso')
 
         conn_mock = libvirt_rw_mock.return_value
-        pool_mock.listAllVolumes.assert_called_once_with()
+        pool_mock.storageVolLookupByName.assert_called_once_with(
+            'image-iso-%s.img' % domain_mock.UUIDString.return_value)
+        old_volume_mock = pool_mock.storageVolLookupByName.return_value
+        old_volume_mock.delete.assert_called_once_with()
         stat_mock.assert_called_once_with('/tmp/image.iso')
         pool_mock.createXML.assert_called_once_with(mock.ANY)
 
@@ -618,13 +653,16 @@ class LibvirtDriverTestCase(base.BaseTestCase):
         with mock.patch.object(
                 self.test_driver, 'get_power_state', return_value='Off'):
             with mock.patch.object(
-                    self.test_driver, 'get_boot_device', return_value=None):
+                    self.test_driver, '_find_boot_device', return_value=None):
 
                 self.test_driver.set_boot_image(
                     self.uuid, 'Cd', '/tmp/image.iso')
 
         conn_mock = libvirt_rw_mock.return_value
-        pool_mock.listAllVolumes.assert_called_once_with()
+        pool_mock.storageVolLookupByName.assert_called_once_with(
+            'image-iso-%s.img' % domain_mock.UUIDString.return_value)
+        old_volume_mock = pool_mock.storageVolLookupByName.return_value
+        old_volume_mock.delete.assert_called_once_with()
         stat_mock.assert_called_once_with('/tmp/image.iso')
         pool_mock.createXML.assert_called_once_with(mock.ANY)
 
@@ -647,6 +685,30 @@ class LibvirtDriverTestCase(base.BaseTestCase):
         self.assertEqual(1, conn_mock.defineXML.call_count)
         self.assertIn(expected_disk, conn_mock.defineXML.call_args[0][0])
 
+    @mock.patch('sushy_tools.emulator.resources.systems.libvirtdriver'
+                '.os.stat', autospec=True)
+    @mock.patch('sushy_tools.emulator.resources.systems.libvirtdriver'
+                '.open')
+    def test__upload_image_no_existing_volume(self, open_mock, stat_mock):
+        with open('sushy_tools/tests/unit/emulator/pool.xml', 'r') as f:
+            data = f.read()
+
+        conn_mock = mock.MagicMock()
+        domain_mock = mock.MagicMock()
+        domain_mock.UUIDString.return_value = self.uuid
+        pool_mock = conn_mock.storagePoolLookupByName.return_value
+        pool_mock.XMLDesc.return_value = data
+        pool_mock.storageVolLookupByName.side_effect = libvirt.libvirtError(
+            'Storage volume not found')
+
+        self.test_driver._upload_image(
+            domain_mock, conn_mock, '/tmp/image.iso')
+
+        pool_mock.storageVolLookupByName.assert_called_once_with(
+            'image-iso-%s.img' % self.uuid)
+        pool_mock.listAllVolumes.assert_not_called()
+        pool_mock.createXML.assert_called_once_with(mock.ANY)
+
     @mock.patch('libvirt.open', autospec=True)
     @mock.patch('libvirt.openReadOnly', autospec=True)
     @mock.patch(
@@ -654,10 +716,10 @@ class LibvirtDriverTestCase(base.BaseTestCase):
         '.get_power_state', new=mock.MagicMock(return_value='Off'))
     @mock.patch(
         'sushy_tools.emulator.resources.systems.libvirtdriver.LibvirtDriver'
-        '.get_boot_device', return_value='Cd')
+        '._find_boot_device', return_value='Cd')
     @mock.patch(
         'sushy_tools.emulator.resources.systems.libvirtdriver.LibvirtDriver'
-        '.set_boot_device')
+        '._update_boot_device')
     @mock.patch(
         'sushy_tools.emulator.resources.systems.libvirtdriver.LibvirtDriver'
         '._add_boot_image', new=mock.MagicMock())
@@ -665,7 +727,7 @@ class LibvirtDriverTestCase(base.BaseTestCase):
         'sushy_tools.emulator.resources.systems.libvirtdriver.LibvirtDriver'
         '._remove_boot_images', new=mock.MagicMock())
     def test_set_boot_image_restore_boot_device(
-            self, sbd_mock, gbd_mock, libvirt_mock, libvirt_rw_mock):
+            self, ubd_mock, fbd_mock, libvirt_mock, libvirt_rw_mock):
 
         with open('sushy_tools/tests/unit/emulator/domain.xml', 'r') as f:
             data = f.read()
@@ -677,8 +739,52 @@ class LibvirtDriverTestCase(base.BaseTestCase):
         self.test_driver.set_boot_image(
             self.uuid, 'Cd', '/tmp/image.iso')
 
-        gbd_mock.assert_called_once_with(self.uuid)
-        sbd_mock.assert_called_once_with(self.uuid, 'Cd')
+        fbd_mock.assert_called_once_with(mock.ANY)
+        ubd_mock.assert_called_once_with(domain_mock, mock.ANY, 'Cd')
+        domain_mock.XMLDesc.assert_called_once_with(
+            libvirt.VIR_DOMAIN_XML_INACTIVE)
+        self.assertEqual(1, conn_mock.defineXML.call_count)
+
+    @mock.patch('sushy_tools.emulator.resources.systems.libvirtdriver'
+                '.os.stat', autospec=True)
+    @mock.patch('sushy_tools.emulator.resources.systems.libvirtdriver'
+                '.open')
+    @mock.patch('libvirt.open', autospec=True)
+    def test_set_boot_image_restore_boot_device_xml(
+            self, libvirt_rw_mock, open_mock, stat_mock):
+        with open('sushy_tools/tests/unit/emulator/'
+                  'domain_boot_disk.xml', 'r') as f:
+            data = f.read()
+
+        conn_mock = libvirt_rw_mock.return_value
+        domain_mock = conn_mock.lookupByUUID.return_value
+        domain_mock.XMLDesc.return_value = data
+
+        pool_mock = conn_mock.storagePoolLookupByName.return_value
+
+        with open('sushy_tools/tests/unit/emulator/pool.xml', 'r') as f:
+            data = f.read()
+
+        pool_mock.XMLDesc.return_value = data
+
+        self.test_driver.set_boot_image(self.uuid, 'Cd', '/tmp/image.iso')
+
+        conn_mock.defineXML.assert_called_once_with(mock.ANY)
+
+        tree = ET.fromstring(conn_mock.defineXML.call_args[0][0])
+        cdrom_elements = tree.findall("devices/disk[@device='cdrom']")
+        self.assertEqual(1, len(cdrom_elements))
+
+        source_element = cdrom_elements[0].find('source')
+        self.assertTrue(source_element.get('file').startswith(
+            '/var/lib/libvirt/images/image-iso-'))
+
+        boot_elements = cdrom_elements[0].findall('boot')
+        self.assertEqual(1, len(boot_elements))
+        self.assertEqual('1', boot_elements[0].get('order'))
+
+        disk_element = tree.find("devices/disk[@device='disk']")
+        self.assertIsNone(disk_element.find('boot'))
 
     @mock.patch('libvirt.openReadOnly', autospec=True)
     def test_get_total_memory(self, libvirt_mock):
@@ -701,6 +807,19 @@ class LibvirtDriverTestCase(base.BaseTestCase):
         cpus = self.test_driver.get_total_cpus(self.uuid)
 
         self.assertEqual(2, cpus)
+        domain_mock.XMLDesc.assert_not_called()
+
+    @mock.patch('libvirt.openReadOnly', autospec=True)
+    def test_get_total_cpus_inactive(self, libvirt_mock):
+        conn_mock = libvirt_mock.return_value
+        domain_mock = conn_mock.lookupByUUID.return_value
+        domain_mock.isActive.return_value = False
+        domain_mock.XMLDesc.return_value = b'<domain><vcpu>4</vcpu></domain>'
+
+        cpus = self.test_driver.get_total_cpus(self.uuid)
+
+        self.assertEqual(4, cpus)
+        domain_mock.maxVcpus.assert_not_called()
 
     @mock.patch('libvirt.open', autospec=True)
     def test_get_bios(self, libvirt_mock):
@@ -918,6 +1037,8 @@ class LibvirtDriverTestCase(base.BaseTestCase):
         }
 
         self.assertEqual(simple_storage_response, simple_storage_expected)
+        # one connection for the domain lookup, one for all the volumes
+        self.assertEqual(2, libvirt_mock.call_count)
 
     @mock.patch('libvirt.openReadOnly', autospec=True)
     def test_get_simple_storage_collection_empty(self, libvirt_mock):
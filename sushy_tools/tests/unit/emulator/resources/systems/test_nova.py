@@ -119,6 +119,12 @@ class NovaDriverTestCase(base.BaseTestCase):
         compute.reboot_server.assert_called_once_with(
             self.uuid, reboot_type='HARD')
 
+    def test_set_power_state_unknown(self):
+        self.assertRaises(
+            error.FishyError, self.test_driver.set_power_state,
+            self.uuid, 'Nmi')
+        self.nova_mock.return_value.get_server.assert_not_called()
+
     def test_get_boot_device(self):
         server = mock.Mock(id=self.uuid)
         self.nova_mock.return_value.get_server.return_value = server
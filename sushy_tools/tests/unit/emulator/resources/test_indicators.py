@@ -45,6 +45,12 @@ class StaticDriverTestCase(base.BaseTestCase):
         state = self.test_driver.get_indicator_state(self.UUID)
         self.assertEqual('Off', state)
 
+    def test_get_indicator_state_default(self):
+        identity = '1a3f7e7c-2f2a-4ed0-9b2e-3c4fd1b4e6a1'
+        state = self.test_driver.get_indicator_state(identity)
+        self.assertEqual('Lit', state)
+        self.assertIn(identity, self.test_driver.indicators)
+
     def test_set_indicator_state_ok(self):
         self.test_driver.set_indicator_state(self.UUID, 'Lit')
         state = self.test_driver.get_indicator_state(self.UUID)
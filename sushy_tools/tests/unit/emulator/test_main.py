@@ -145,10 +145,11 @@ class ManagersTestCase(EmulatorTestCase):
 
     @patch_resource('managers')
     def test_manager_collection_resource(self, managers_mock):
-        type(managers_mock.return_value).managers = mock.PropertyMock(
-            return_value=['bmc0', 'bmc1'])
+        managers_prop = mock.PropertyMock(return_value=['bmc0', 'bmc1'])
+        type(managers_mock.return_value).managers = managers_prop
         response = self.app.get('/redfish/v1/Managers')
         self.assertEqual(200, response.status_code)
+        managers_prop.assert_called_once_with()
         self.assertEqual({'@odata.id': '/redfish/v1/Managers/bmc0'},
                          response.json['Members'][0])
         self.assertEqual({'@odata.id': '/redfish/v1/Managers/bmc1'},